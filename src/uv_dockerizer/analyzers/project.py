@@ -1,15 +1,120 @@
 """Project analyzer to detect project configuration and dependencies."""
 
+import copy
+import dataclasses
+import hashlib
+import json
+import os
+import re
 import sys
+from functools import lru_cache
 from pathlib import Path
+from typing import Any
 
 if sys.version_info >= (3, 11):
     import tomllib
 else:
     import tomli as tomllib
 
+from uv_dockerizer import __version__
 from uv_dockerizer.models import Framework, ProjectInfo, ProjectType
 
+# Project path plus mtimes of the project directory, pyproject.toml, uv.lock and .python-version
+_AnalysisKey = tuple[str, int, int, int, int]
+
+# Analysis results keyed on the project path and the mtimes of the files they derive from
+_ANALYSIS_CACHE: dict[_AnalysisKey, ProjectInfo] = {}
+_ANALYSIS_CACHE_SIZE = 32
+
+# Version of the persisted analysis format; bump whenever ProjectInfo or the analysis changes
+_CACHE_SCHEMA = 2
+
+# Parsed pyproject.toml documents keyed on path and mtime
+_TOML_CACHE: dict[tuple[str, int], dict[str, Any]] = {}
+_TOML_CACHE_SIZE = 32
+
+# Frameworks that need the full (non-slim) base image
+_HEAVY_FRAMEWORKS = frozenset(
+    {Framework.PANDAS, Framework.NUMPY, Framework.PYTORCH, Framework.TENSORFLOW}
+)
+
+# Frameworks that benefit from pre-compiled wheels on a slim base
+_WHEEL_FRAMEWORKS = frozenset({Framework.PANDAS, Framework.NUMPY})
+
+# Recommendations that apply to every project
+_BASE_OPTIMIZATIONS = (
+    "Multi-stage build to reduce final image size",
+    "Non-root user for security",
+    "Leverage Docker layer caching for dependencies",
+)
+
+# First lower-bound or exact version in a specifier like ">=3.12" or "<4,~=3.11.4";
+# upper bounds ("<", "<=") and exclusions ("!=") are skipped
+_PYREQ_RE = re.compile(r"(?:^|,)\s*(?:===|==|~=|>=|>)?\s*(\d+(?:\.\d+)*)")
+
+# Leading "major.minor" of a .python-version entry, keeping suffixes like "3.13t"
+_PY_VERSION_RE = re.compile(r"(\d+\.[^.]+)")
+
+# Leading distribution name of a PEP 508 requirement string
+_PKG_RE = re.compile(r"\s*([A-Za-z0-9_.\-]+)")
+
+
+def _mtime_ns(path: Path) -> int:
+    """Return the modification time of a path in nanoseconds, or 0 if it is missing."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except (FileNotFoundError, NotADirectoryError):
+        return 0
+
+
+def _cache_dir() -> Path:
+    """Return the directory used to persist analysis results between runs.
+
+    Raises:
+        RuntimeError: If XDG_CACHE_HOME is unset and the home directory is unknown.
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "uv-dockerizer"
+
+
+def _cache_file(project_path: str) -> Path:
+    """Return the cache file for a project.
+
+    There is one file per project, overwritten whenever it is re-analyzed. The
+    package version and _CACHE_SCHEMA are part of the hash so changes to the
+    analysis never read results produced by older code.
+    """
+    digest = hashlib.sha256(repr((__version__, _CACHE_SCHEMA, project_path)).encode())
+    return _cache_dir() / f"{digest.hexdigest()}.json"
+
+
+def _load_cached(key: _AnalysisKey) -> ProjectInfo | None:
+    """Load a persisted analysis result, or None if it is missing, stale or unreadable."""
+    try:
+        record = json.loads(_cache_file(key[0]).read_bytes())
+        if record["key"] != list(key):
+            return None
+        data = record["info"]
+        data["path"] = Path(data["path"])
+        data["project_type"] = ProjectType(data["project_type"])
+        data["frameworks"] = [Framework(f) for f in data["frameworks"]]
+        return ProjectInfo(**data)
+    except (OSError, RuntimeError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _store_cached(key: _AnalysisKey, info: ProjectInfo) -> None:
+    """Persist an analysis result; failures only cost a re-analysis next time."""
+    try:
+        path = _cache_file(key[0])
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        record = {"key": list(key), "info": dataclasses.asdict(info)}
+        tmp.write_text(json.dumps(record, default=str))
+        os.replace(tmp, path)
+    except (OSError, RuntimeError):
+        pass
+
 
 class ProjectAnalyzer:
     """Analyzes a Python project to extract configuration for Docker generation."""
@@ -49,19 +154,67 @@ class ProjectAnalyzer:
         self.requirements_path = self.path / "requirements.txt"
         self.python_version_path = self.path / ".python-version"
 
+        # Snapshot of the project root, taken by _analyze() on a cache miss
+        self._entries: dict[str, os.DirEntry[str]] = {}
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop all memoized analysis results and parsed pyproject.toml files."""
+        _ANALYSIS_CACHE.clear()
+        _TOML_CACHE.clear()
+        try:
+            for path in _cache_dir().glob("*.json"):
+                path.unlink(missing_ok=True)
+        except (OSError, RuntimeError):
+            pass
+
     def analyze(self) -> ProjectInfo:
         """Analyze the project and return project information.
 
+        Results are memoized per project, in memory and under the user cache
+        directory, and reused until the project directory, pyproject.toml,
+        uv.lock or .python-version change on disk.
+
+        Returns:
+            ProjectInfo with detected configuration.
+        """
+        key: _AnalysisKey = (
+            str(self.path),
+            _mtime_ns(self.path),
+            _mtime_ns(self.pyproject_path),
+            _mtime_ns(self.uv_lock_path),
+            _mtime_ns(self.python_version_path),
+        )
+        cached = _ANALYSIS_CACHE.get(key)
+        if cached is None:
+            cached = _load_cached(key)
+            if cached is None:
+                cached = self._analyze()
+                _store_cached(key, cached)
+            if len(_ANALYSIS_CACHE) >= _ANALYSIS_CACHE_SIZE:
+                # Evict the oldest entry (dicts preserve insertion order)
+                del _ANALYSIS_CACHE[next(iter(_ANALYSIS_CACHE))]
+            _ANALYSIS_CACHE[key] = cached
+
+        # Hand out a copy so callers can't mutate the cached result
+        return copy.deepcopy(cached)
+
+    def _analyze(self) -> ProjectInfo:
+        """Run the full project analysis without consulting the cache.
+
         Returns:
             ProjectInfo with detected configuration.
         """
+        # List the project root once so existence checks are dict lookups
+        self._entries = self._scan_root()
+
         # Start with basic info
         info = ProjectInfo(
             name=self.path.name,
             path=self.path,
-            has_uv_lock=self.uv_lock_path.exists(),
-            has_pyproject=self.pyproject_path.exists(),
-            has_requirements=self.requirements_path.exists(),
+            has_uv_lock=self._has("uv.lock"),
+            has_pyproject=self._has("pyproject.toml"),
+            has_requirements=self._has("requirements.txt"),
         )
 
         # Parse pyproject.toml if exists
@@ -71,8 +224,8 @@ class ProjectAnalyzer:
         # Detect Python version
         info.python_version = self._detect_python_version()
 
-        # Detect frameworks from dependencies
-        info.frameworks = self._detect_frameworks(info.dependencies)
+        # Detect frameworks and their ports from dependencies
+        info.frameworks, info.exposed_ports = self._analyze_deps(info.dependencies)
 
         # Detect project type
         info.project_type = self._detect_project_type(info)
@@ -80,22 +233,50 @@ class ProjectAnalyzer:
         # Determine recommended base image
         info.recommended_base_image = self._recommend_base_image(info)
 
-        # Detect ports to expose
-        info.exposed_ports = self._detect_ports(info)
-
         # Generate optimization recommendations
         info.recommended_optimizations = self._generate_optimizations(info)
 
         return info
 
+    def _scan_root(self) -> dict[str, os.DirEntry[str]]:
+        """List the project root.
+
+        Returns:
+            Mapping of entry name to directory entry, empty if the path is not a directory.
+        """
+        try:
+            with os.scandir(self.path) as it:
+                return {entry.name: entry for entry in it}
+        except (FileNotFoundError, NotADirectoryError):
+            return {}
+
+    def _has(self, name: str, is_dir: bool = False) -> bool:
+        """Check whether the project root contains a file or directory.
+
+        Like Path.exists(), symlinks are followed, so dangling links count as missing.
+
+        Args:
+            name: Entry name in the project root.
+            is_dir: Look for a directory instead of a regular file.
+
+        Returns:
+            True if the entry exists with the requested type.
+        """
+        entry = self._entries.get(name)
+        if entry is None:
+            return False
+        try:
+            return entry.is_dir() if is_dir else entry.is_file()
+        except OSError:
+            return False
+
     def _parse_pyproject(self, info: ProjectInfo) -> None:
         """Parse pyproject.toml and extract relevant information.
 
         Args:
             info: ProjectInfo to populate.
         """
-        with open(self.pyproject_path, "rb") as f:
-            data = tomllib.load(f)
+        data = self._load_pyproject()
 
         project = data.get("project", {})
 
@@ -107,23 +288,37 @@ class ProjectAnalyzer:
         requires_python = project.get("requires-python", "")
         if requires_python:
             # Extract version like ">=3.12" -> "3.12"
-            version = requires_python.replace(">=", "").replace("==", "").replace("~=", "")
-            version = version.split(",")[0].strip()
+            version = self._major_minor(requires_python)
             if version:
                 info.python_version = version
 
         # Dependencies
-        info.dependencies = project.get("dependencies", [])
+        info.dependencies = list(project.get("dependencies", []))
 
         # Optional dependencies (dev)
         optional_deps = project.get("optional-dependencies", {})
-        info.dev_dependencies = optional_deps.get("dev", [])
+        info.dev_dependencies = list(optional_deps.get("dev", []))
 
         # Scripts/entry points
-        info.scripts = project.get("scripts", {})
+        info.scripts = dict(project.get("scripts", {}))
         if info.scripts:
             # First script is likely the main entry point
-            info.entry_point = list(info.scripts.keys())[0]
+            info.entry_point = next(iter(info.scripts))
+
+    def _load_pyproject(self) -> dict[str, Any]:
+        """Load pyproject.toml, reusing the parsed document while the file is unchanged.
+
+        Returns:
+            Parsed TOML document.
+        """
+        key = (str(self.pyproject_path), self.pyproject_path.stat().st_mtime_ns)
+        data = _TOML_CACHE.get(key)
+        if data is None:
+            data = tomllib.loads(self.pyproject_path.read_bytes().decode())
+            if len(_TOML_CACHE) >= _TOML_CACHE_SIZE:
+                del _TOML_CACHE[next(iter(_TOML_CACHE))]
+            _TOML_CACHE[key] = data
+        return data
 
     def _detect_python_version(self) -> str:
         """Detect Python version from .python-version file or pyproject.toml.
@@ -131,46 +326,72 @@ class ProjectAnalyzer:
         Returns:
             Python version string.
         """
-        if self.python_version_path.exists():
-            version = self.python_version_path.read_text().strip()
-            # Handle versions like "3.12.1" -> "3.12"
-            parts = version.split(".")
-            if len(parts) >= 2:
-                return f"{parts[0]}.{parts[1]}"
-            return version
+        if self._has(".python-version"):
+            # Only the first line matters; bound the read in case of an unexpected file
+            with self.python_version_path.open() as f:
+                version = f.readline(32).strip()
+            # Handle versions like "3.12.1" -> "3.12"; anything else (e.g. "pypy3.10") is kept
+            match = _PY_VERSION_RE.match(version)
+            return match.group(1) if match else version
         return "3.12"  # Default
 
-    def _detect_frameworks(self, dependencies: list[str]) -> list[Framework]:
-        """Detect frameworks from dependencies.
+    @staticmethod
+    def _major_minor(spec: str) -> str | None:
+        """Extract a "major.minor" version from a version or specifier string.
 
         Args:
-            dependencies: List of project dependencies.
+            spec: Specifier like ">=3.12", "<4,>=3.10" or ">=3".
 
         Returns:
-            List of detected frameworks.
+            Version like "3.12" (or "3" if no minor is given), or None if no
+            version is present.
         """
-        frameworks = []
-        dep_names = {self._extract_package_name(dep).lower() for dep in dependencies}
+        match = _PYREQ_RE.search(spec)
+        if match is None:
+            return None
+        return ".".join(match.group(1).split(".", 2)[:2])
 
-        for pattern, framework in self.FRAMEWORK_PATTERNS.items():
-            if pattern in dep_names:
-                frameworks.append(framework)
+    def _analyze_deps(self, dependencies: list[str]) -> tuple[list[Framework], list[int]]:
+        """Detect frameworks and the ports they expose.
 
-        return frameworks
+        Args:
+            dependencies: List of project dependencies.
+
+        Returns:
+            Tuple of (detected frameworks, ports to expose).
+        """
+        found: set[Framework] = set()
+        for dep in dependencies:
+            framework = self.FRAMEWORK_PATTERNS.get(self._extract_package_name(dep))
+            if framework is not None:
+                found.add(framework)
+
+        if not found:
+            return [], []
+
+        # Keep the declaration order of FRAMEWORK_PATTERNS for stable output. Ports follow
+        # the same order, which is also the server priority used by the Dockerfile CMD,
+        # so exposed_ports[0] is the port the container actually serves on.
+        frameworks = [f for f in self.FRAMEWORK_PATTERNS.values() if f in found]
+        ports = dict.fromkeys(
+            self.FRAMEWORK_PORTS[f] for f in frameworks if f in self.FRAMEWORK_PORTS
+        )
+        return frameworks, list(ports)
 
-    def _extract_package_name(self, dependency: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=2048)
+    def _extract_package_name(dependency: str) -> str:
         """Extract package name from dependency string.
 
         Args:
             dependency: Dependency string like "fastapi>=0.100.0".
 
         Returns:
-            Package name.
+            Lowercased package name.
         """
-        # Handle various formats: "pkg", "pkg>=1.0", "pkg[extra]>=1.0"
-        name = dependency.split(">=")[0].split("<=")[0].split("==")[0].split("~=")[0]
-        name = name.split("[")[0]
-        return name.strip()
+        # Handle various formats: "pkg", "pkg>=1.0", "pkg[extra]>=1.0", "pkg; marker"
+        match = _PKG_RE.match(dependency)
+        return match.group(1).lower() if match else ""
 
     def _detect_project_type(self, info: ProjectInfo) -> ProjectType:
         """Detect project type from frameworks and structure.
@@ -181,7 +402,7 @@ class ProjectAnalyzer:
         Returns:
             Detected ProjectType.
         """
-        frameworks = set(info.frameworks)
+        frameworks = info.frameworks
 
         # API projects
         if Framework.FASTAPI in frameworks or Framework.FLASK in frameworks:
@@ -203,7 +424,7 @@ class ProjectAnalyzer:
             return ProjectType.CLI
 
         # Check for src layout
-        if (self.path / "src").exists():
+        if self._has("src", is_dir=True):
             return ProjectType.LIB
 
         return ProjectType.UNKNOWN
@@ -218,30 +439,14 @@ class ProjectAnalyzer:
             Recommended base image string.
         """
         version = info.python_version
-        frameworks = set(info.frameworks)
 
         # Data science / ML projects need more libraries
-        if frameworks & {Framework.PANDAS, Framework.NUMPY, Framework.PYTORCH, Framework.TENSORFLOW}:
+        if not _HEAVY_FRAMEWORKS.isdisjoint(info.frameworks):
             return f"python:{version}-bookworm"
 
         # Default to slim for most projects
         return f"python:{version}-slim"
 
-    def _detect_ports(self, info: ProjectInfo) -> list[int]:
-        """Detect ports to expose based on frameworks.
-
-        Args:
-            info: ProjectInfo with detected frameworks.
-
-        Returns:
-            List of ports to expose.
-        """
-        ports = []
-        for framework in info.frameworks:
-            if framework in self.FRAMEWORK_PORTS:
-                ports.append(self.FRAMEWORK_PORTS[framework])
-        return list(set(ports))  # Remove duplicates
-
     def _generate_optimizations(self, info: ProjectInfo) -> list[str]:
         """Generate optimization recommendations.
 
@@ -251,22 +456,17 @@ class ProjectAnalyzer:
         Returns:
             List of optimization recommendations.
         """
-        optimizations = []
-
-        if info.has_uv_lock:
-            optimizations.append("Use uv.lock for reproducible builds")
-        else:
-            optimizations.append("Consider creating uv.lock for reproducible builds")
-
-        optimizations.append("Multi-stage build to reduce final image size")
-        optimizations.append("Non-root user for security")
-        optimizations.append("Leverage Docker layer caching for dependencies")
+        optimizations = [
+            "Use uv.lock for reproducible builds"
+            if info.has_uv_lock
+            else "Consider creating uv.lock for reproducible builds",
+            *_BASE_OPTIMIZATIONS,
+        ]
 
         if info.project_type == ProjectType.API:
             optimizations.append("Add healthcheck endpoint")
 
-        frameworks = set(info.frameworks)
-        if frameworks & {Framework.PANDAS, Framework.NUMPY}:
+        if not _WHEEL_FRAMEWORKS.isdisjoint(info.frameworks):
             optimizations.append("Consider using slim base with pre-compiled wheels")
 
         return optimizations
@@ -1,11 +1,11 @@
 """CLI interface for uv-dockerizer."""
 
+import os
 from pathlib import Path
 from typing import Annotated
 
 import typer
 from rich.console import Console
-from rich.panel import Panel
 
 from uv_dockerizer import __version__
 
@@ -18,6 +18,41 @@ app = typer.Typer(
 console = Console()
 
 
+def _write_file(path: Path, content: str) -> None:
+    """Write a single file with one open/write/close, without pathlib's extra stat calls."""
+    data = memoryview(content.encode())
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        while data:
+            data = data[os.write(fd, data) :]
+    finally:
+        os.close(fd)
+
+
+def _write_all(pending: list[tuple[Path, str]]) -> None:
+    """Write generated files concurrently.
+
+    Parent directories are created once per unique directory, then the
+    independent file writes are issued in parallel from a small thread pool.
+
+    Args:
+        pending: List of (path, content) pairs to write.
+    """
+    for parent in {path.parent for path, _ in pending}:
+        os.makedirs(parent, exist_ok=True)
+
+    if len(pending) < 2:
+        for path, content in pending:
+            _write_file(path, content)
+        return
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=min(len(pending), 8)) as executor:
+        # Consume the results so the first failed write is re-raised here
+        list(executor.map(lambda item: _write_file(*item), pending))
+
+
 def version_callback(value: bool) -> None:
     """Print version and exit."""
     if value:
@@ -112,6 +147,8 @@ def init(
     - CI/CD pipelines (optional)
     - IaC templates (optional)
     """
+    from rich.panel import Panel
+
     from uv_dockerizer.analyzers.project import ProjectAnalyzer
     from uv_dockerizer.generators.dockerfile import DockerfileGenerator
 
@@ -132,25 +169,35 @@ def init(
     console.print(f"[green]✓[/green] Project type: [bold]{project_info.project_type}[/bold]")
     console.print(f"[green]✓[/green] Dependencies: [bold]{len(project_info.dependencies)}[/bold]")
 
+    # List the output directory once instead of checking each file separately
+    try:
+        with os.scandir(output) as it:
+            existing = {entry.name for entry in it}
+    except FileNotFoundError:
+        existing = set()
+
+    # Files are collected here and written together once everything is generated
+    pending: list[tuple[Path, str]] = []
+
     # Generate Dockerfile
     generator = DockerfileGenerator(project_info, base_image=base_image)
     dockerfile_content = generator.generate()
 
     output_path = output / "Dockerfile"
-    if output_path.exists() and not force:
+    if "Dockerfile" in existing and not force:
         console.print(
             "\n[yellow]⚠[/yellow] Dockerfile already exists. Use [bold]--force[/bold] to overwrite."
         )
         raise typer.Exit(1)
 
-    output_path.write_text(dockerfile_content)
+    pending.append((output_path, dockerfile_content))
     console.print("\n[green]✓[/green] Generated [bold]Dockerfile[/bold]")
 
     # Generate .dockerignore
     dockerignore_path = output / ".dockerignore"
-    if not dockerignore_path.exists() or force:
+    if ".dockerignore" not in existing or force:
         dockerignore_content = generator.generate_dockerignore()
-        dockerignore_path.write_text(dockerignore_content)
+        pending.append((dockerignore_path, dockerignore_content))
         console.print("[green]✓[/green] Generated [bold].dockerignore[/bold]")
 
     # Generate Docker Compose if requested
@@ -160,8 +207,8 @@ def init(
         compose_gen = ComposeGenerator(project_info)
         compose_content = compose_gen.generate()
         compose_path = output / "docker-compose.yml"
-        if not compose_path.exists() or force:
-            compose_path.write_text(compose_content)
+        if "docker-compose.yml" not in existing or force:
+            pending.append((compose_path, compose_content))
             console.print("[green]✓[/green] Generated [bold]docker-compose.yml[/bold]")
 
     # Generate CI/CD if requested
@@ -169,7 +216,7 @@ def init(
         from uv_dockerizer.generators.ci import CIGenerator
 
         ci_gen = CIGenerator(project_info, provider=ci)
-        ci_gen.generate(output, force=force)
+        pending.extend(ci_gen.render(output, force=force))
         console.print(f"[green]✓[/green] Generated [bold]{ci}[/bold] CI/CD configuration")
 
     # Generate IaC if requested
@@ -177,9 +224,11 @@ def init(
         from uv_dockerizer.iac import IaCGenerator
 
         iac_gen = IaCGenerator(project_info, provider=iac)
-        iac_gen.generate(output, force=force)
+        pending.extend(iac_gen.render(output, force=force))
         console.print(f"[green]✓[/green] Generated [bold]{iac}[/bold] IaC templates")
 
+    _write_all(pending)
+
     console.print(
         Panel(
             "[green]✨ Docker configuration generated successfully![/green]\n\n"
@@ -207,6 +256,8 @@ def analyze(
     ] = Path("."),
 ) -> None:
     """🔍 Analyze a Python project and show detected configuration."""
+    from rich.panel import Panel
+
     from uv_dockerizer.analyzers.project import ProjectAnalyzer
 
     console.print(
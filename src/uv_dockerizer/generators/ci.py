@@ -4,42 +4,9 @@ from pathlib import Path
 
 from uv_dockerizer.models import ProjectInfo
 
-
-class CIGenerator:
-    """Generates CI/CD configuration files."""
-
-    def __init__(self, project_info: ProjectInfo, provider: str = "github") -> None:
-        """Initialize the generator.
-
-        Args:
-            project_info: Analyzed project information.
-            provider: CI provider (github, gitlab).
-        """
-        self.project = project_info
-        self.provider = provider.lower()
-
-    def generate(self, output_path: Path, force: bool = False) -> None:
-        """Generate CI configuration files.
-
-        Args:
-            output_path: Output directory.
-            force: Overwrite existing files.
-        """
-        if self.provider == "github":
-            self._generate_github_actions(output_path, force)
-        elif self.provider == "gitlab":
-            self._generate_gitlab_ci(output_path, force)
-
-    def _generate_github_actions(self, output_path: Path, force: bool) -> None:
-        """Generate GitHub Actions workflow."""
-        workflow_dir = output_path / ".github" / "workflows"
-        workflow_dir.mkdir(parents=True, exist_ok=True)
-
-        workflow_path = workflow_dir / "docker.yml"
-        if workflow_path.exists() and not force:
-            return
-
-        content = f'''name: Docker Build & Push
+# Static CI templates. These are plain strings (not f-strings), so the
+# ${{ ... }} expressions below are emitted verbatim for the CI provider.
+_GITHUB_WORKFLOW = """name: Docker Build & Push
 
 on:
   push:
@@ -50,7 +17,7 @@ on:
 
 env:
   REGISTRY: ghcr.io
-  IMAGE_NAME: ${{{{ github.repository }}}}
+  IMAGE_NAME: ${{ github.repository }}
 
 jobs:
   build:
@@ -70,41 +37,34 @@ jobs:
         if: github.event_name != 'pull_request'
         uses: docker/login-action@v3
         with:
-          registry: ${{{{ env.REGISTRY }}}}
-          username: ${{{{ github.actor }}}}
-          password: ${{{{ secrets.GITHUB_TOKEN }}}}
+          registry: ${{ env.REGISTRY }}
+          username: ${{ github.actor }}
+          password: ${{ secrets.GITHUB_TOKEN }}
 
       - name: Extract metadata
         id: meta
         uses: docker/metadata-action@v5
         with:
-          images: ${{{{ env.REGISTRY }}}}/${{{{ env.IMAGE_NAME }}}}
+          images: ${{ env.REGISTRY }}/${{ env.IMAGE_NAME }}
           tags: |
             type=ref,event=branch
             type=ref,event=pr
-            type=semver,pattern={{{{version}}}}
-            type=semver,pattern={{{{major}}}}.{{{{minor}}}}
+            type=semver,pattern={{version}}
+            type=semver,pattern={{major}}.{{minor}}
 
       - name: Build and push
         uses: docker/build-push-action@v5
         with:
           context: .
-          push: ${{{{ github.event_name != 'pull_request' }}}}
-          tags: ${{{{ steps.meta.outputs.tags }}}}
-          labels: ${{{{ steps.meta.outputs.labels }}}}
+          push: ${{ github.event_name != 'pull_request' }}
+          tags: ${{ steps.meta.outputs.tags }}
+          labels: ${{ steps.meta.outputs.labels }}
           cache-from: type=gha
           cache-to: type=gha,mode=max
-'''
-
-        workflow_path.write_text(content)
+"""
 
-    def _generate_gitlab_ci(self, output_path: Path, force: bool) -> None:
-        """Generate GitLab CI configuration."""
-        ci_path = output_path / ".gitlab-ci.yml"
-        if ci_path.exists() and not force:
-            return
 
-        content = f'''stages:
+_GITLAB_CI = """stages:
   - build
   - test
   - deploy
@@ -148,6 +108,61 @@ test:
     - uv run pytest
   rules:
     - if: $CI_COMMIT_BRANCH
-'''
+"""
+
+
+class CIGenerator:
+    """Generates CI/CD configuration files."""
+
+    def __init__(self, project_info: ProjectInfo, provider: str = "github") -> None:
+        """Initialize the generator.
+
+        Args:
+            project_info: Analyzed project information.
+            provider: CI provider (github, gitlab).
+        """
+        self.project = project_info
+        self.provider = provider.lower()
+
+    def generate(self, output_path: Path, force: bool = False) -> None:
+        """Generate CI configuration files.
+
+        Args:
+            output_path: Output directory.
+            force: Overwrite existing files.
+        """
+        for path, content in self.render(output_path, force=force):
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(content)
+
+    def render(self, output_path: Path, force: bool = False) -> list[tuple[Path, str]]:
+        """Render CI configuration files without writing them.
+
+        Args:
+            output_path: Output directory.
+            force: Include files that already exist.
+
+        Returns:
+            List of (path, content) pairs to write.
+        """
+        if self.provider == "github":
+            return self._generate_github_actions(output_path, force)
+        if self.provider == "gitlab":
+            return self._generate_gitlab_ci(output_path, force)
+        return []
+
+    def _generate_github_actions(self, output_path: Path, force: bool) -> list[tuple[Path, str]]:
+        """Generate GitHub Actions workflow."""
+        workflow_path = output_path / ".github" / "workflows" / "docker.yml"
+        if workflow_path.exists() and not force:
+            return []
+
+        return [(workflow_path, _GITHUB_WORKFLOW)]
+
+    def _generate_gitlab_ci(self, output_path: Path, force: bool) -> list[tuple[Path, str]]:
+        """Generate GitLab CI configuration."""
+        ci_path = output_path / ".gitlab-ci.yml"
+        if ci_path.exists() and not force:
+            return []
 
-        ci_path.write_text(content)
+        return [(ci_path, _GITLAB_CI)]
@@ -1,10 +1,19 @@
 """Docker Compose generator."""
 
-import yaml
+import json
 
 from uv_dockerizer.models import Framework, ProjectInfo
 
 
+def _quote(value: str) -> str:
+    """Render a string as a double-quoted YAML scalar.
+
+    JSON strings are valid YAML, so names like "true", "1.0" or "my app: x"
+    stay strings and never break the document.
+    """
+    return json.dumps(value)
+
+
 class ComposeGenerator:
     """Generates Docker Compose files for projects."""
 
@@ -22,93 +31,71 @@ class ComposeGenerator:
         Returns:
             Docker Compose YAML content.
         """
-        compose = {
-            "services": self._generate_services(),
-        }
-
-        # Add volumes if needed
-        volumes = self._generate_volumes()
-        if volumes:
-            compose["volumes"] = volumes
+        return f"""services:
+{self._generate_services()}{self._generate_volumes()}networks:
+  default:
+    name: {_quote(f"{self.project.name}-network")}
+"""
 
-        # Add networks
-        compose["networks"] = {
-            "default": {
-                "name": f"{self.project.name}-network",
-            }
-        }
-
-        return yaml.dump(compose, default_flow_style=False, sort_keys=False)
-
-    def _generate_services(self) -> dict:
+    def _generate_services(self) -> str:
         """Generate services configuration."""
-        services = {}
+        name = self.project.name
+        uses_celery = Framework.CELERY in self.project.frameworks
 
         # Main application service
-        app_service = {
-            "build": {
-                "context": ".",
-                "dockerfile": "Dockerfile",
-            },
-            "container_name": self.project.name,
-            "restart": "unless-stopped",
-        }
+        app_service = f"""  app:
+    build:
+      context: .
+      dockerfile: Dockerfile
+    container_name: {_quote(name)}
+    restart: unless-stopped
+"""
 
         # Add ports
         if self.project.exposed_ports:
-            app_service["ports"] = [f"{p}:{p}" for p in self.project.exposed_ports]
+            ports = "\n".join(f'      - "{p}:{p}"' for p in self.project.exposed_ports)
+            app_service += f"    ports:\n{ports}\n"
 
         # Add environment variables
-        app_service["environment"] = {
-            "PYTHONUNBUFFERED": "1",
-        }
+        app_service += '    environment:\n      PYTHONUNBUFFERED: "1"\n'
+        if uses_celery:
+            app_service += "      REDIS_URL: redis://redis:6379/0\n"
 
         # Add volumes for development
-        app_service["volumes"] = [
-            "./src:/app/src:ro",
-        ]
-
-        services["app"] = app_service
-
-        # Add additional services based on frameworks
-        frameworks = set(self.project.frameworks)
-
-        # Add Redis for Celery
-        if Framework.CELERY in frameworks:
-            services["redis"] = {
-                "image": "redis:7-alpine",
-                "container_name": f"{self.project.name}-redis",
-                "ports": ["6379:6379"],
-                "volumes": ["redis-data:/data"],
-            }
-            services["app"]["depends_on"] = ["redis"]
-            services["app"]["environment"]["REDIS_URL"] = "redis://redis:6379/0"
-
-            # Add Celery worker
-            services["worker"] = {
-                "build": {
-                    "context": ".",
-                    "dockerfile": "Dockerfile",
-                },
-                "container_name": f"{self.project.name}-worker",
-                "command": ["celery", "-A", self.project.name.replace("-", "_"), "worker", "--loglevel=info"],
-                "depends_on": ["redis"],
-                "environment": {
-                    "REDIS_URL": "redis://redis:6379/0",
-                },
-            }
-
-        # Add database services based on common patterns
-        # This is a placeholder - could be enhanced with project analysis
-
-        return services
-
-    def _generate_volumes(self) -> dict:
+        app_service += "    volumes:\n      - ./src:/app/src:ro\n"
+
+        if not uses_celery:
+            return app_service
+
+        # Add Redis and a Celery worker for Celery projects
+        return f"""{app_service}    depends_on:
+      - redis
+  redis:
+    image: redis:7-alpine
+    container_name: {_quote(f"{name}-redis")}
+    ports:
+      - "6379:6379"
+    volumes:
+      - redis-data:/data
+  worker:
+    build:
+      context: .
+      dockerfile: Dockerfile
+    container_name: {_quote(f"{name}-worker")}
+    command:
+      - celery
+      - -A
+      - {_quote(name.replace("-", "_"))}
+      - worker
+      - --loglevel=info
+    depends_on:
+      - redis
+    environment:
+      REDIS_URL: redis://redis:6379/0
+"""
+
+    def _generate_volumes(self) -> str:
         """Generate volumes configuration."""
-        volumes = {}
-        frameworks = set(self.project.frameworks)
-
-        if Framework.CELERY in frameworks:
-            volumes["redis-data"] = {}
-
-        return volumes
+        if Framework.CELERY in self.project.frameworks:
+            return "volumes:\n  redis-data: {}\n"
+        return ""
@@ -25,20 +25,36 @@ class IaCGenerator:
             output_path: Output directory.
             force: Overwrite existing files.
         """
+        for path, content in self.render(output_path, force=force):
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(content)
+
+    def render(self, output_path: Path, force: bool = False) -> list[tuple[Path, str]]:
+        """Render IaC templates without writing them.
+
+        Args:
+            output_path: Output directory.
+            force: Include files that already exist.
+
+        Returns:
+            List of (path, content) pairs to write.
+        """
         iac_dir = output_path / "infrastructure" / self.provider
-        iac_dir.mkdir(parents=True, exist_ok=True)
 
         if self.provider == "terraform":
-            self._generate_terraform(iac_dir, force)
-        elif self.provider == "pulumi":
-            self._generate_pulumi(iac_dir, force)
+            return self._generate_terraform(iac_dir, force)
+        if self.provider == "pulumi":
+            return self._generate_pulumi(iac_dir, force)
+        return []
 
-    def _generate_terraform(self, output_path: Path, force: bool) -> None:
+    def _generate_terraform(self, output_path: Path, force: bool) -> list[tuple[Path, str]]:
         """Generate Terraform configuration."""
+        files: list[tuple[Path, str]] = []
+
         # Main configuration
         main_tf = output_path / "main.tf"
         if not main_tf.exists() or force:
-            main_tf.write_text(f'''# Terraform configuration for {self.project.name}
+            files.append((main_tf, f'''# Terraform configuration for {self.project.name}
 # Generated by uv-dockerizer
 
 terraform {{
@@ -169,13 +185,13 @@ resource "aws_iam_role" "ecs_task" {{
 
   tags = var.tags
 }}
-''')
+'''))
 
         # Variables
         variables_tf = output_path / "variables.tf"
         if not variables_tf.exists() or force:
             port = self.project.exposed_ports[0] if self.project.exposed_ports else 8000
-            variables_tf.write_text(f'''# Variables for {self.project.name}
+            files.append((variables_tf, f'''# Variables for {self.project.name}
 
 variable "aws_region" {{
   description = "AWS region"
@@ -231,12 +247,12 @@ variable "tags" {{
     Generator = "uv-dockerizer"
   }}
 }}
-''')
+'''))
 
         # Outputs
         outputs_tf = output_path / "outputs.tf"
         if not outputs_tf.exists() or force:
-            outputs_tf.write_text(f'''# Outputs for {self.project.name}
+            files.append((outputs_tf, f'''# Outputs for {self.project.name}
 
 output "ecr_repository_url" {{
   description = "ECR repository URL"
@@ -252,23 +268,27 @@ output "ecs_cluster_arn" {{
   description = "ECS cluster ARN"
   value       = aws_ecs_cluster.main.arn
 }}
-''')
+'''))
+
+        return files
 
-    def _generate_pulumi(self, output_path: Path, force: bool) -> None:
+    def _generate_pulumi(self, output_path: Path, force: bool) -> list[tuple[Path, str]]:
         """Generate Pulumi configuration."""
+        files: list[tuple[Path, str]] = []
+
         # Pulumi.yaml
         pulumi_yaml = output_path / "Pulumi.yaml"
         if not pulumi_yaml.exists() or force:
-            pulumi_yaml.write_text(f'''name: {self.project.name}
+            files.append((pulumi_yaml, f'''name: {self.project.name}
 runtime: python
 description: Infrastructure for {self.project.name}
-''')
+'''))
 
         # __main__.py
         main_py = output_path / "__main__.py"
         if not main_py.exists() or force:
             port = self.project.exposed_ports[0] if self.project.exposed_ports else 8000
-            main_py.write_text(f'''"""Pulumi infrastructure for {self.project.name}."""
+            files.append((main_py, f'''"""Pulumi infrastructure for {self.project.name}."""
 
 import pulumi
 import pulumi_aws as aws
@@ -331,14 +351,16 @@ execution_role_policy = aws.iam.RolePolicyAttachment(
 pulumi.export("ecr_repository_url", ecr_repo.repository_url)
 pulumi.export("ecs_cluster_name", ecs_cluster.name)
 pulumi.export("ecs_cluster_arn", ecs_cluster.arn)
-''')
+'''))
 
         # requirements.txt for Pulumi
         requirements = output_path / "requirements.txt"
         if not requirements.exists() or force:
-            requirements.write_text('''pulumi>=3.0.0
+            files.append((requirements, '''pulumi>=3.0.0
 pulumi-aws>=6.0.0
-''')
+'''))
+
+        return files
 
 
 __all__ = ["IaCGenerator"]
@@ -1,10 +1,8 @@
 """Data models for uv-dockerizer."""
 
+from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Optional
-
-from pydantic import BaseModel, Field
 
 
 class ProjectType(str, Enum):
@@ -43,58 +41,94 @@ class Framework(str, Enum):
     TENSORFLOW = "tensorflow"
 
 
-class ProjectInfo(BaseModel):
-    """Information about the analyzed project."""
-
-    name: str = Field(description="Project name")
-    version: str = Field(default="0.1.0", description="Project version")
-    python_version: str = Field(default="3.12", description="Python version")
-    project_type: ProjectType = Field(default=ProjectType.UNKNOWN, description="Type of project")
-    path: Path = Field(description="Project path")
+@dataclass(slots=True, kw_only=True)
+class ProjectInfo:
+    """Information about the analyzed project.
+
+    Attributes:
+        name: Project name.
+        version: Project version.
+        python_version: Python version.
+        project_type: Type of project.
+        path: Project path.
+        dependencies: Project dependencies.
+        dev_dependencies: Dev dependencies.
+        has_uv_lock: Has uv.lock file.
+        has_pyproject: Has pyproject.toml.
+        has_requirements: Has requirements.txt.
+        frameworks: Detected frameworks.
+        entry_point: Main entry point.
+        scripts: Project scripts.
+        recommended_optimizations: Recommended optimizations.
+        recommended_base_image: Recommended base image.
+        build_args: Build arguments.
+        env_vars: Environment variables.
+        exposed_ports: Ports to expose.
+    """
+
+    name: str
+    version: str = "0.1.0"
+    python_version: str = "3.12"
+    project_type: ProjectType = ProjectType.UNKNOWN
+    path: Path
 
     # Dependencies
-    dependencies: list[str] = Field(default_factory=list, description="Project dependencies")
-    dev_dependencies: list[str] = Field(default_factory=list, description="Dev dependencies")
+    dependencies: list[str] = field(default_factory=list)
+    dev_dependencies: list[str] = field(default_factory=list)
 
     # Detection results
-    has_uv_lock: bool = Field(default=False, description="Has uv.lock file")
-    has_pyproject: bool = Field(default=False, description="Has pyproject.toml")
-    has_requirements: bool = Field(default=False, description="Has requirements.txt")
-    frameworks: list[Framework] = Field(default_factory=list, description="Detected frameworks")
+    has_uv_lock: bool = False
+    has_pyproject: bool = False
+    has_requirements: bool = False
+    frameworks: list[Framework] = field(default_factory=list)
 
     # Entry points
-    entry_point: Optional[str] = Field(default=None, description="Main entry point")
-    scripts: dict[str, str] = Field(default_factory=dict, description="Project scripts")
+    entry_point: str | None = None
+    scripts: dict[str, str] = field(default_factory=dict)
 
     # Optimizations
-    recommended_optimizations: list[str] = Field(
-        default_factory=list, description="Recommended optimizations"
-    )
-    recommended_base_image: str = Field(
-        default="python:3.12-slim", description="Recommended base image"
-    )
+    recommended_optimizations: list[str] = field(default_factory=list)
+    recommended_base_image: str = "python:3.12-slim"
 
     # Build configuration
-    build_args: dict[str, str] = Field(default_factory=dict, description="Build arguments")
-    env_vars: dict[str, str] = Field(default_factory=dict, description="Environment variables")
-    exposed_ports: list[int] = Field(default_factory=list, description="Ports to expose")
-
-
-class DockerConfig(BaseModel):
-    """Docker configuration options."""
-
-    base_image: str = Field(default="python:3.12-slim", description="Base Docker image")
-    multi_stage: bool = Field(default=True, description="Use multi-stage build")
-    use_uv: bool = Field(default=True, description="Use uv for package installation")
-    non_root_user: bool = Field(default=True, description="Run as non-root user")
-    healthcheck: bool = Field(default=True, description="Include healthcheck")
-    labels: dict[str, str] = Field(default_factory=dict, description="Docker labels")
-
-
-class ComposeConfig(BaseModel):
-    """Docker Compose configuration."""
-
-    version: str = Field(default="3.9", description="Compose file version")
-    services: dict = Field(default_factory=dict, description="Services configuration")
-    volumes: dict = Field(default_factory=dict, description="Volumes configuration")
-    networks: dict = Field(default_factory=dict, description="Networks configuration")
+    build_args: dict[str, str] = field(default_factory=dict)
+    env_vars: dict[str, str] = field(default_factory=dict)
+    exposed_ports: list[int] = field(default_factory=list)
+
+
+@dataclass(slots=True, kw_only=True)
+class DockerConfig:
+    """Docker configuration options.
+
+    Attributes:
+        base_image: Base Docker image.
+        multi_stage: Use multi-stage build.
+        use_uv: Use uv for package installation.
+        non_root_user: Run as non-root user.
+        healthcheck: Include healthcheck.
+        labels: Docker labels.
+    """
+
+    base_image: str = "python:3.12-slim"
+    multi_stage: bool = True
+    use_uv: bool = True
+    non_root_user: bool = True
+    healthcheck: bool = True
+    labels: dict[str, str] = field(default_factory=dict)
+
+
+@dataclass(slots=True, kw_only=True)
+class ComposeConfig:
+    """Docker Compose configuration.
+
+    Attributes:
+        version: Compose file version.
+        services: Services configuration.
+        volumes: Volumes configuration.
+        networks: Networks configuration.
+    """
+
+    version: str = "3.9"
+    services: dict = field(default_factory=dict)
+    volumes: dict = field(default_factory=dict)
+    networks: dict = field(default_factory=dict)
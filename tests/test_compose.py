@@ -0,0 +1,46 @@
+"""Tests for the Docker Compose generator."""
+
+from pathlib import Path
+
+import pytest
+
+from uv_dockerizer.generators.compose import ComposeGenerator
+from uv_dockerizer.models import Framework, ProjectInfo
+
+yaml = pytest.importorskip("yaml")
+
+
+def _project(name: str, frameworks: list[Framework], ports: list[int]) -> ProjectInfo:
+    """Build a minimal ProjectInfo for compose generation."""
+    return ProjectInfo(name=name, path=Path("/project"), frameworks=frameworks, exposed_ports=ports)
+
+
+@pytest.mark.parametrize("name", ["demo-app", "true", "null", "1.0", "my app: x"])
+def test_generate_without_celery_is_valid_yaml(name: str) -> None:
+    """The plain app layout parses back with project names kept as strings."""
+    compose = yaml.safe_load(ComposeGenerator(_project(name, [], [])).generate())
+
+    app = compose["services"]["app"]
+    assert app["container_name"] == name
+    assert app["environment"] == {"PYTHONUNBUFFERED": "1"}
+    assert "ports" not in app
+    assert "volumes" not in compose
+    assert compose["networks"]["default"]["name"] == f"{name}-network"
+
+
+@pytest.mark.parametrize("name", ["demo-app", "true", "null", "1.0", "my app: x"])
+def test_generate_with_celery_is_valid_yaml(name: str) -> None:
+    """The Celery layout parses back with project names kept as strings."""
+    project = _project(name, [Framework.FASTAPI, Framework.CELERY], [8000])
+    compose = yaml.safe_load(ComposeGenerator(project).generate())
+
+    services = compose["services"]
+    assert services["app"]["container_name"] == name
+    assert services["app"]["ports"] == ["8000:8000"]
+    assert services["app"]["depends_on"] == ["redis"]
+    assert services["app"]["environment"]["REDIS_URL"] == "redis://redis:6379/0"
+    assert services["redis"]["container_name"] == f"{name}-redis"
+    assert services["worker"]["container_name"] == f"{name}-worker"
+    assert services["worker"]["command"][2] == name.replace("-", "_")
+    assert compose["volumes"] == {"redis-data": {}}
+    assert compose["networks"]["default"]["name"] == f"{name}-network"
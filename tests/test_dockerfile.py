@@ -0,0 +1,58 @@
+"""Tests for the Dockerfile generator."""
+
+import re
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from uv_dockerizer.analyzers.project import ProjectAnalyzer
+from uv_dockerizer.generators.dockerfile import DockerfileGenerator
+
+# Ports the generated CMD serves on when it does not pass --port explicitly
+_DEFAULT_CMD_PORTS = {"flask": 5000, "streamlit": 8501, "manage.py": 8000}
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    """Keep analysis results out of the user's cache directory."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache-home"))
+    ProjectAnalyzer.clear_cache()
+    yield
+    ProjectAnalyzer.clear_cache()
+
+
+def _cmd_port(dockerfile: str) -> int:
+    """Return the port the Dockerfile's CMD serves on."""
+    cmd = next(line for line in dockerfile.splitlines() if line.startswith("CMD ["))
+    explicit = re.search(r'"--port", "(\d+)"', cmd)
+    if explicit:
+        return int(explicit.group(1))
+    return next(port for word, port in _DEFAULT_CMD_PORTS.items() if f'"{word}"' in cmd)
+
+
+@pytest.mark.parametrize(
+    "dependencies",
+    [
+        ["fastapi"],
+        ["flask"],
+        ["flask", "fastapi"],
+        ["fastapi", "flask"],
+        ["streamlit", "flask"],
+        ["django", "flask"],
+    ],
+)
+def test_healthcheck_port_matches_cmd_port(tmp_path: Path, dependencies: list[str]) -> None:
+    """The HEALTHCHECK and the first exposed port point at the server the CMD starts."""
+    root = tmp_path / "demo"
+    root.mkdir()
+    deps = ", ".join(f'"{dep}"' for dep in dependencies)
+    (root / "pyproject.toml").write_text(f'[project]\nname = "demo"\ndependencies = [{deps}]\n')
+
+    info = ProjectAnalyzer(root).analyze()
+    dockerfile = DockerfileGenerator(info).generate()
+
+    healthcheck = re.search(r"http://localhost:(\d+)/health", dockerfile)
+    assert healthcheck is not None
+    assert int(healthcheck.group(1)) == _cmd_port(dockerfile)
+    assert info.exposed_ports[0] == _cmd_port(dockerfile)
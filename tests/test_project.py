@@ -0,0 +1,187 @@
+"""Tests for the project analyzer."""
+
+import os
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from uv_dockerizer.analyzers import project as project_module
+from uv_dockerizer.analyzers.project import ProjectAnalyzer
+from uv_dockerizer.models import Framework, ProjectType
+
+
+@pytest.fixture(autouse=True)
+def cache_home(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    """Point the persistent cache at a temporary directory and start from a clean state."""
+    cache_home = tmp_path / "cache-home"
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache_home))
+    ProjectAnalyzer.clear_cache()
+    yield cache_home / "uv-dockerizer"
+    ProjectAnalyzer.clear_cache()
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    """Create a small FastAPI project."""
+    root = tmp_path / "demo"
+    root.mkdir()
+    (root / "pyproject.toml").write_text(
+        '[project]\nname = "demo"\ndependencies = ["fastapi>=0.100"]\n'
+    )
+    return root
+
+
+def _forget_in_memory() -> None:
+    """Drop in-memory caches so the next analyze() has to consult the disk."""
+    project_module._ANALYSIS_CACHE.clear()
+    project_module._TOML_CACHE.clear()
+
+
+def _bump_mtime(path: Path) -> None:
+    """Move a file's mtime forward so cache keys change even on coarse clocks."""
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+def test_persisted_result_round_trips(
+    project: Path, cache_home: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A persisted result is loaded back from disk without re-analysis."""
+    info = ProjectAnalyzer(project).analyze()
+    assert len(list(cache_home.glob("*.json"))) == 1
+
+    _forget_in_memory()
+
+    def fail(self: ProjectAnalyzer) -> None:
+        raise AssertionError("analysis should have been served from disk")
+
+    monkeypatch.setattr(ProjectAnalyzer, "_analyze", fail)
+    cached = ProjectAnalyzer(project).analyze()
+
+    assert cached == info
+    assert cached.project_type is ProjectType.API
+    assert cached.frameworks == [Framework.FASTAPI]
+    assert isinstance(cached.path, Path)
+
+
+def test_corrupt_cache_file_falls_back_to_analysis(project: Path, cache_home: Path) -> None:
+    """An unreadable cache file is ignored and replaced by a fresh analysis."""
+    info = ProjectAnalyzer(project).analyze()
+    (cache_file,) = cache_home.glob("*.json")
+    cache_file.write_text("{not json")
+
+    _forget_in_memory()
+
+    assert ProjectAnalyzer(project).analyze() == info
+    assert project_module._load_cached(next(iter(project_module._ANALYSIS_CACHE))) == info
+
+
+def test_changed_pyproject_invalidates_and_overwrites(project: Path, cache_home: Path) -> None:
+    """Editing pyproject.toml re-analyzes and overwrites the project's cache file."""
+    assert ProjectAnalyzer(project).analyze().frameworks == [Framework.FASTAPI]
+
+    pyproject = project / "pyproject.toml"
+    pyproject.write_text('[project]\nname = "demo"\ndependencies = ["flask"]\n')
+    _bump_mtime(pyproject)
+    _forget_in_memory()
+
+    assert ProjectAnalyzer(project).analyze().frameworks == [Framework.FLASK]
+    assert len(list(cache_home.glob("*.json"))) == 1
+
+
+def test_schema_bump_ignores_persisted_results(
+    project: Path, cache_home: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Results written under an older _CACHE_SCHEMA are not loaded."""
+    ProjectAnalyzer(project).analyze()
+    (key,) = project_module._ANALYSIS_CACHE
+    assert project_module._load_cached(key) is not None
+
+    monkeypatch.setattr(project_module, "_CACHE_SCHEMA", project_module._CACHE_SCHEMA + 1)
+
+    assert project_module._load_cached(key) is None
+
+
+def test_unknown_home_directory_disables_persistence(
+    project: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """analyze() still works when no cache directory can be resolved."""
+    monkeypatch.delenv("XDG_CACHE_HOME")
+
+    def no_home() -> Path:
+        raise RuntimeError("Could not determine home directory.")
+
+    monkeypatch.setattr(Path, "home", staticmethod(no_home))
+
+    assert ProjectAnalyzer(project).analyze().name == "demo"
+    ProjectAnalyzer.clear_cache()
+
+
+def test_missing_project_path_returns_defaults(tmp_path: Path) -> None:
+    """A missing project directory yields a default ProjectInfo."""
+    info = ProjectAnalyzer(tmp_path / "missing").analyze()
+
+    assert info.name == "missing"
+    assert info.project_type is ProjectType.UNKNOWN
+    assert not info.has_pyproject
+
+
+def test_file_project_path_returns_defaults(tmp_path: Path) -> None:
+    """A regular file instead of a project directory yields a default ProjectInfo."""
+    not_a_dir = tmp_path / "some_file"
+    not_a_dir.write_text("")
+
+    info = ProjectAnalyzer(not_a_dir).analyze()
+
+    assert info.name == "some_file"
+    assert info.project_type is ProjectType.UNKNOWN
+    assert not info.has_pyproject
+
+
+def test_dangling_symlinks_count_as_missing(tmp_path: Path) -> None:
+    """Broken pyproject.toml and .python-version links are ignored like missing files."""
+    root = tmp_path / "linked"
+    root.mkdir()
+    (root / "pyproject.toml").symlink_to(tmp_path / "nonexistent.toml")
+    (root / ".python-version").symlink_to(tmp_path / "nonexistent-version")
+
+    info = ProjectAnalyzer(root).analyze()
+
+    assert not info.has_pyproject
+    assert info.python_version == "3.12"
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        ("3.12.1", "3.12"),
+        ("3.12", "3.12"),
+        ("3", "3"),
+        ("3.13t", "3.13t"),
+        ("pypy3.10", "pypy3.10"),
+    ],
+)
+def test_python_version_file(tmp_path: Path, raw: str, expected: str) -> None:
+    """.python-version is truncated to major.minor without rewriting other interpreters."""
+    root = tmp_path / "versioned"
+    root.mkdir()
+    (root / ".python-version").write_text(f"{raw}\n")
+
+    assert ProjectAnalyzer(root).analyze().python_version == expected
+
+
+@pytest.mark.parametrize(
+    ("spec", "expected"),
+    [
+        (">=3.12", "3.12"),
+        ("<4,>=3.10", "3.10"),
+        ("!=3.0,>=3.8", "3.8"),
+        ("~=3.11.4", "3.11"),
+        (">=3", "3"),
+        ("<4", None),
+    ],
+)
+def test_requires_python_lower_bound(spec: str, expected: str | None) -> None:
+    """requires-python parsing skips upper bounds and exclusions."""
+    assert ProjectAnalyzer._major_minor(spec) == expected